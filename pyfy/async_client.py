@@ -86,6 +86,14 @@ class AsyncSpotify(_BaseClient):
             * Max TCP connections per host from the same session
 
             * Default: 1000
+
+        session (aiohttp.ClientSession):
+
+            * Session to send all requests through, so that its connection pool is reused across requests
+
+            * Must be created inside a coroutine running on the client's loop. Closing it is left to the caller
+
+            * Default: None (A new session is created for every request)
     """
 
     IS_ASYNC = True
@@ -103,6 +111,7 @@ class AsyncSpotify(_BaseClient):
         default_to_locale=True,
         populate_user_creds=True,
         max_connections=1000,
+        session=None,
     ):
 
         # unsupported session settings
@@ -111,6 +120,7 @@ class AsyncSpotify(_BaseClient):
 
         self.proxy_auth = proxy_auth
         self.max_connections = max_connections
+        self._shared_session = session
 
         super().__init__(
             access_token,
@@ -279,21 +289,30 @@ class AsyncSpotify(_BaseClient):
         )
 
     async def _send_requests(self, *reqs, return_gather_exceptions=False, gather=False):
+        if self._shared_session is not None:  # Owned by the caller, so don't close it
+            return await self._send_requests_with_session(
+                self._shared_session, reqs, return_gather_exceptions, gather
+            )
         async with self._session as sess:
-            if gather is True:
-                tasks = [
-                    asyncio.ensure_future(self._send_request_with_backoff(req, sess))
-                    for req in reqs
-                ]
-                results = await asyncio.gather(
-                    *tasks, return_exceptions=return_gather_exceptions
-                )
-            elif gather is False:
-                results = await self._send_request_with_backoff(reqs[0], sess)
-            else:
-                await sess.close()
-                raise ValueError("Gather must be either True or False")
-        return results
+            return await self._send_requests_with_session(
+                sess, reqs, return_gather_exceptions, gather
+            )
+
+    async def _send_requests_with_session(
+        self, sess, reqs, return_gather_exceptions, gather
+    ):
+        if gather is True:
+            tasks = [
+                asyncio.ensure_future(self._send_request_with_backoff(req, sess))
+                for req in reqs
+            ]
+            return await asyncio.gather(
+                *tasks, return_exceptions=return_gather_exceptions
+            )
+        elif gather is False:
+            return await self._send_request_with_backoff(reqs[0], sess)
+        else:
+            raise ValueError("Gather must be either True or False")
 
     async def _send_request_with_backoff(self, req, sess):
         # workaround to support setting instance specific timeouts and maxretries. (Mainly because you can't pass `self` to a decorator)
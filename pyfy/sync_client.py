@@ -128,13 +128,16 @@ class Spotify(_BaseClient):
             total=max_retries,
             backoff_factor=backoff_factor,
             status_forcelist=[429],
-            method_whitelist=["GET", "UPDATE", "DELETE"],
+            allowed_methods=["GET", "UPDATE", "DELETE"],
+            raise_on_status=False,  # The last 429 still goes through raise_for_status -> ApiError
         )
-        retries_adapter = HTTPAdapter(max_retries=retries)
+        # Mounted for https too, which is what the Spotify endpoints actually use
         if cache:
-            cache_adapter = CacheControlAdapter(cache_etags=True)
-        sess.mount("http://", retries_adapter)
-        sess.mount("http://", cache_adapter)
+            adapter = CacheControlAdapter(cache_etags=True, max_retries=retries)
+        else:
+            adapter = HTTPAdapter(max_retries=retries)
+        sess.mount("http://", adapter)
+        sess.mount("https://", adapter)
         sess.proxies.update(proxies)
         return sess
 
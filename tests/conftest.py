@@ -1,7 +1,21 @@
+from types import SimpleNamespace
+
+from aiohttp import ClientSession, TCPConnector
 from pytest import fixture
 
 from pyfy import Spotify, ClientCreds, UserCreds, AsyncSpotify
-from pyfy.utils import _safe_getitem
+
+
+def _client_creds_from_env(show_dialog=False):
+    client = ClientCreds(show_dialog=show_dialog)
+    client.load_from_env()
+    return client
+
+
+def _user_creds_from_env():
+    user = UserCreds()
+    user.load_from_env()
+    return user
 
 
 @fixture(scope="function")
@@ -11,31 +25,22 @@ def spotify():
 
 @fixture(scope="function")
 def client_creds_from_env_session():
-    client = ClientCreds()
-    client.load_from_env()
-    client.show_dialog = "true"
-    yield client
+    yield _client_creds_from_env(show_dialog="true")
 
 
 @fixture(scope="function")
 def user_creds_from_env_session():
-    user = UserCreds()
-    user.load_from_env()
-    yield user
+    yield _user_creds_from_env()
 
 
 @fixture(scope="function")
 def client_creds_from_env():
-    client = ClientCreds()
-    client.load_from_env()
-    client.show_dialog = "true"
-    yield client
+    yield _client_creds_from_env(show_dialog="true")
 
 
 @fixture(scope="function")
 def user_creds_from_env():
-    user = UserCreds()
-    user.load_from_env()
+    user = _user_creds_from_env()
     if not user.access_token:
         raise AttributeError("User must have an access token for some tests to run")
     yield user
@@ -43,45 +48,61 @@ def user_creds_from_env():
 
 @fixture(scope="session")
 def spotify_user_auth():
-    spotify = Spotify()
-    user_creds = UserCreds()
-    client_creds = ClientCreds()
-    client_creds.load_from_env()
-    user_creds.load_from_env()
-    spotify.client_creds = client_creds
-    spotify.user_creds = user_creds
+    # Doesn't call me() on assignment, the sync integration conftest populates the creds inside a cassette
+    # No HTTP cache either, CacheControl can't wrap the responses vcrpy replays
+    spotify = Spotify(populate_user_creds=False, cache=False)
+    spotify.client_creds = _client_creds_from_env()
+    spotify.user_creds = _user_creds_from_env()
     spotify._caller = spotify.user_creds
     yield spotify
 
 
 @fixture(scope="session")
-def async_spotify_user_auth():
-    spotify = AsyncSpotify()
-    user_creds = UserCreds()
-    client_creds = ClientCreds()
-    client_creds.load_from_env()
-    user_creds.load_from_env()
-    spotify.client_creds = client_creds
-    spotify.user_creds = user_creds
-    spotify._caller = spotify.user_creds
-    yield spotify
+async def async_spotify_user_auth():
+    # One aiohttp session for the whole run, so its connection pool is reused by every test
+    connector = TCPConnector(
+        limit=32,
+        limit_per_host=8,  # Requests beyond this wait for a free connection instead of tripping a 429
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+    )
+    async with ClientSession(connector=connector) as session:
+        spotify = AsyncSpotify(session=session)
+        spotify.client_creds = _client_creds_from_env()
+        spotify.user_creds = _user_creds_from_env()
+        spotify._caller = spotify.user_creds
+        yield spotify
 
 
 @fixture(scope="function")
 def spotify_client_auth():
     spotify = Spotify()
-    client_creds = ClientCreds()
-    client_creds.load_from_env()
-    spotify.client_creds = client_creds
+    spotify.client_creds = _client_creds_from_env()
     yield spotify
 
 
 @fixture(scope="function")
 def async_spotify_client_auth():
     spotify = AsyncSpotify()
-    client_creds = ClientCreds()
-    client_creds.load_from_env()
-    spotify.client_creds = client_creds
+    spotify.client_creds = _client_creds_from_env()
+    yield spotify
+
+
+@fixture(scope="session")
+def spotify_client_authorized():
+    # Fetches one client credentials token for the whole run
+    spotify = Spotify()
+    spotify.client_creds = _client_creds_from_env()
+    spotify.authorize_client_creds()
+    yield spotify
+
+
+@fixture(scope="session")
+async def async_spotify_client_authorized():
+    spotify = AsyncSpotify()
+    spotify.client_creds = _client_creds_from_env()
+    await spotify.authorize_client_creds()
     yield spotify
 
 
@@ -106,146 +127,44 @@ def me_stub():
     }
 
 
-@fixture
-def cover_me_track_id():
-    return "18Om2WhO0dlFHKqcMcpxxA"
-
-
-@fixture
-def in_your_room_track_id():
-    return "60hzrNGckC5cho1JkmyVm4"
-
-
-@fixture
-def voodoo_in_my_blood_track_id():
-    return "0DRe2MeIAT5Bf1kOhRPJ4H"
-
-
-@fixture
-def sonne_track_id():
-    return "6VS4C2HnOQPivcjcAAlUMj"
-
-
-@fixture
-def rammstein_artist_id():
-    return "6wWVKhxIU2cEi0K81v7HvP"
-
-
-@fixture
-def depeche_mode_artist_id():
-    return "762310PdDnwsDxAQxzQkfX"
-
-
-@fixture
-def massive_attack_artist_id():
-    return "6FXMGgJwohJLUSr5nVlf9X"
-
-
-@fixture
-def songs_of_faith_and_devotion_album_id():
-    return "6x7S6u9Cx2S0JD48nPsavE"
-
-
-@fixture
-def far_and_off_album_id():
-    return "2EmxGavHNvex1vNWfoq9yI"
-
-
-@fixture
-def reise_reise_album_id():
-    return "74ydDCcXTco741y42ceRJ5"
-
-
-@fixture
-def ritual_spirit_album_id():
-    return "6KHhT15M6l7cgaPZamEpM3"
-
-
-@fixture
-def biosphere_public_playlist_id():
-    return "37i9dQZF1DZ06evO1ov2lQ"
-
-
-@fixture
-def aes_dana_public_playlist_id():
-    return "37i9dQZF1DZ06evO3LdcHu"
-
-
-@fixture
-def metal_essentials_playlist_id():
-    return "37i9dQZF1DWWOaP4H0w5b0"
-
-
-@fixture
-def brian_eno_playlist_id():
-    return "22dXpXoyZjk9bhZABaIDOq"
-
-
-@fixture
-def the_metal_podcast_id():
-    return "0O1qo57pGLPvk5BcK7HXk6"
-
-
-@fixture
-def ambient_podcast_id():
-    return "279ykQVh10jwcXuaikY82k"
-
-
-@fixture
-def john_smith_user_id():
-    return "1235168545"
-
-
-@fixture
-def spotify_test_user_id():
-    return "asbmkbqbyrh657mrrzx4c94dd"
-
-
-@fixture
-def test_artist_id():
-    return "5OV9PowyUJwaXMsLC9GlEE"
-
+_IDS = SimpleNamespace(
+    cover_me_track_id="18Om2WhO0dlFHKqcMcpxxA",
+    in_your_room_track_id="60hzrNGckC5cho1JkmyVm4",
+    voodoo_in_my_blood_track_id="0DRe2MeIAT5Bf1kOhRPJ4H",
+    sonne_track_id="6VS4C2HnOQPivcjcAAlUMj",
+    rammstein_artist_id="6wWVKhxIU2cEi0K81v7HvP",
+    depeche_mode_artist_id="762310PdDnwsDxAQxzQkfX",
+    massive_attack_artist_id="6FXMGgJwohJLUSr5nVlf9X",
+    songs_of_faith_and_devotion_album_id="6x7S6u9Cx2S0JD48nPsavE",
+    far_and_off_album_id="2EmxGavHNvex1vNWfoq9yI",
+    reise_reise_album_id="74ydDCcXTco741y42ceRJ5",
+    ritual_spirit_album_id="6KHhT15M6l7cgaPZamEpM3",
+    biosphere_public_playlist_id="37i9dQZF1DZ06evO1ov2lQ",
+    aes_dana_public_playlist_id="37i9dQZF1DZ06evO3LdcHu",
+    metal_essentials_playlist_id="37i9dQZF1DWWOaP4H0w5b0",
+    brian_eno_playlist_id="22dXpXoyZjk9bhZABaIDOq",
+    the_metal_podcast_id="0O1qo57pGLPvk5BcK7HXk6",
+    ambient_podcast_id="279ykQVh10jwcXuaikY82k",
+    john_smith_user_id="1235168545",
+    spotify_test_user_id="asbmkbqbyrh657mrrzx4c94dd",
+    test_artist_id="5OV9PowyUJwaXMsLC9GlEE",
+    testing_funny_artist_id="1X8mNJTyrSeJ6XrTwOfC1u",  # That's an actual band (testing funny)
+    gods_plan_track_id="6DCZcSspjsKoFjzjrWoCdn",
+    pound_cake_track_id="4RI9eX7jNcdaQOJifn7t6z",
+    nothing_was_the_same_album_id="2ZUFSbIkmFkGag000RWOpA",
+    scorpion_album_id="1ATL5GLyefJaxhQzSPVrLX",
+    them_bones_track_id="4A065x9kJt955eGVqf813g",
+)
 
-@fixture
-def testing_funny_artist_id():  # That's an actual band (testing funny)
-    return "1X8mNJTyrSeJ6XrTwOfC1u"
-
-
-@fixture
-def gods_plan_track_id():
-    return "6DCZcSspjsKoFjzjrWoCdn"
-
-
-@fixture
-def pound_cake_track_id():
-    return "4RI9eX7jNcdaQOJifn7t6z"
 
-
-@fixture
-def nothing_was_the_same_album_id():
-    return "2ZUFSbIkmFkGag000RWOpA"
-
-
-@fixture
-def scorpion_album_id():
-    return "1ATL5GLyefJaxhQzSPVrLX"
-
-
-@fixture
-def them_bones_track_id():
-    return "4A065x9kJt955eGVqf813g"
+@fixture(scope="session")
+def ids():
+    return _IDS
 
 
 #### misc
 
 
-@fixture()
+@fixture(scope="session")
 def new_playlist_name():
     return "TEST_PLAYLIST"
-
-
-@fixture(scope="function")
-def new_playlist_id(spotify_user_auth, new_playlist_name):
-    for playlist in spotify_user_auth.user_playlists()["items"]:
-        if _safe_getitem(playlist, "name") == new_playlist_name:
-            return _safe_getitem(playlist, "id")
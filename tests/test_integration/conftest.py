@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+from contextlib import nullcontext
+
+from pytest import fixture, hookimpl, mark
+from vcr import VCR
+
+SCRUBBED_RESPONSE_KEYS = ("access_token", "refresh_token", "email", "birthdate")
+
+
+def _scrub_response(response):
+    # Keeps tokens (e.g. from a refresh mid-test) and the user's profile details out of the cassettes
+    string = response["body"]["string"]
+    try:
+        body = json.loads(string)
+    except (TypeError, ValueError):
+        return response
+    scrubbed = (
+        [key for key in SCRUBBED_RESPONSE_KEYS if key in body]
+        if isinstance(body, dict)
+        else []
+    )
+    if not scrubbed:
+        return response
+    body.update(dict.fromkeys(scrubbed, "SCRUBBED"))
+    string = (
+        json.dumps(body).encode() if isinstance(string, bytes) else json.dumps(body)
+    )
+    response["body"]["string"] = string
+    for header in response["headers"]:
+        if header.lower() == "content-length":
+            response["headers"][header] = [str(len(string))]
+    return response
+
+
+VCR_CONFIG = {
+    "filter_headers": ["authorization"],
+    "filter_post_data_parameters": ["refresh_token", "client_id", "client_secret"],
+    "decode_compressed_response": True,
+    "before_record_response": _scrub_response,
+}
+
+
+def _named_cassettes(cassette_dir, record_mode, disable_recording, config):
+    if disable_recording:
+        return lambda name: nullcontext()
+    recorder = VCR(
+        cassette_library_dir=cassette_dir,
+        record_mode=record_mode,
+        path_transformer=VCR.ensure_suffix(".yaml"),
+        **config,
+    )
+    return recorder.use_cassette
+
+
+@fixture(scope="module")
+def vcr_config():
+    # Tests marked with @pytest.mark.vcr replay recorded responses from ./cassettes
+    # Whether they may also hit the live API is left to --record-mode (see tests/run_tests.py)
+    # Cassettes are gitignored, they are only ever replayed on the machine that recorded them
+    return dict(VCR_CONFIG)
+
+
+@fixture(scope="module")
+def module_cassette(vcr_config, vcr_cassette_dir, record_mode, disable_recording):
+    # Module-scoped fixtures run outside each test's cassette, so they record into their own named ones
+    return _named_cassettes(
+        vcr_cassette_dir, record_mode, disable_recording, vcr_config
+    )
+
+
+@fixture(scope="session")
+def session_cassette(record_mode, disable_recording):
+    # Same for session-scoped fixtures, whose cassettes live in ./cassettes next to this file
+    return _named_cassettes(
+        str(Path(__file__).parent / "cassettes"),
+        record_mode,
+        disable_recording,
+        VCR_CONFIG,
+    )
+
+
+@hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    # Runs before -m deselection, so every test under this directory can be excluded with -m "not integration"
+    here = Path(__file__).parent
+    for item in items:
+        if here in item.path.parents:
+            item.add_marker(mark.integration)
@@ -0,0 +1,100 @@
+import gc
+import asyncio
+
+from aiohttp import ClientSession
+from pytest import fixture, hookimpl
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and doesn't support Windows
+    uvloop = None
+
+
+@hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    # Runs the async suite on uvloop when it's installed
+    if uvloop is None:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@fixture(scope="session")
+def gathered_lifecycle(async_spotify_user_auth):
+    # Runs add -> check -> remove for a single id and a list of ids
+    # Each stage depends on the previous one, the two calls within a stage don't, so they're gathered
+    spt = async_spotify_user_auth
+
+    async def run(add, check, remove, single, multiple):
+        return [
+            await spt.gather(
+                stage(single, to_gather=True), stage(multiple, to_gather=True)
+            )
+            for stage in (add, check, remove)
+        ]
+
+    return run
+
+
+@fixture(scope="module")
+async def owned_playlist(async_spotify_user_auth, new_playlist_name, module_cassette):
+    # Created once for the module's playlist tests and deleted when they're done
+    # Recorded, so the tests' own cassettes replay against the same playlist id
+    with module_cassette("owned_playlist_create"):
+        playlist = await async_spotify_user_auth.create_playlist(new_playlist_name)
+    yield playlist["id"]
+    with module_cassette("owned_playlist_delete"):
+        await async_spotify_user_auth.delete_playlist(playlist["id"])
+
+
+@fixture(scope="module", autouse=True)
+def collect_garbage():
+    # Frees the module's response JSON before the next module starts
+    yield
+    gc.collect()
+
+
+@fixture(scope="module")
+async def aiohttp_session():
+    async with ClientSession() as session:
+        yield session
+
+
+@fixture(scope="module")
+async def bulk_public_result(async_spotify_user_auth, ids, module_cassette):
+    # Sends every independent read the explore tests assert on in one gathered round
+    # A failing endpoint only fails the test that looks its result up
+    spt = async_spotify_user_auth
+    requests = {
+        "categories": spt.categories(to_gather=True),
+        "categories_usa": spt.categories(country="US", to_gather=True),
+        "category_playlist": spt.category_playlist("jazz", to_gather=True),
+        "featured_playlists": spt.featured_playlists(to_gather=True),
+        "new_releases": spt.new_releases(to_gather=True),
+        "recommendations": spt.recommendations(
+            market="US",
+            seed_tracks="0c6xIDDpzE81m2q797ordA",
+            min_energy=0.4,
+            min_popularity=50,
+            to_gather=True,
+        ),
+        "track_audio_analysis": spt.track_audio_analysis(
+            ids.pound_cake_track_id, to_gather=True
+        ),
+        "track_audio_feature": spt.tracks_audio_features(
+            ids.pound_cake_track_id, to_gather=True
+        ),
+        "tracks_audio_features": spt.tracks_audio_features(
+            [ids.pound_cake_track_id, ids.gods_plan_track_id], to_gather=True
+        ),
+        "search": spt.search("where's the revolution", to_gather=True),
+        "available_genre_seeds": spt.available_genre_seeds(to_gather=True),
+    }
+    with module_cassette("bulk_public_result"):
+        responses = await spt.gather(*requests.values(), return_exceptions=True)
+    results = dict(zip(requests, responses))
+
+    def result(name):
+        assert not isinstance(results[name], Exception), results[name]
+        return results[name]
+
+    return result
@@ -1,60 +1,33 @@
 import pytest
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.vcr
 
 
-async def test_save_album(async_spotify_user_auth, nothing_was_the_same_album_id):
-    assert (
-        await async_spotify_user_auth.save_albums(nothing_was_the_same_album_id)
-        is not None
-    )
-
-
-async def test_save_albums(
-    async_spotify_user_auth, scorpion_album_id, nothing_was_the_same_album_id
+@pytest.mark.xdist_group("user_state")
+async def test_save_owns_delete_albums(
+    async_spotify_user_auth, gathered_lifecycle, ids
 ):
-    assert (
-        await async_spotify_user_auth.save_albums(
-            [scorpion_album_id, nothing_was_the_same_album_id]
-        )
-        is not None
-    )
+    spt = async_spotify_user_auth
+    single = ids.scorpion_album_id
+    multiple = [ids.scorpion_album_id, ids.nothing_was_the_same_album_id]
 
-
-async def test_owns_album(async_spotify_user_auth, scorpion_album_id):
-    assert await async_spotify_user_auth.owns_albums(scorpion_album_id)
-
-
-async def test_owns_albums(
-    async_spotify_user_auth, scorpion_album_id, nothing_was_the_same_album_id
-):
-    assert await async_spotify_user_auth.owns_albums(
-        [scorpion_album_id, nothing_was_the_same_album_id]
+    saved, owned, deleted = await gathered_lifecycle(
+        spt.save_albums, spt.owns_albums, spt.delete_albums, single, multiple
     )
+    assert all(result is not None for result in saved)
+    assert all(all(result) for result in owned)
+    assert all(result is not None for result in deleted)
 
 
-async def test_delete_album(async_spotify_user_auth, scorpion_album_id):
-    assert await async_spotify_user_auth.delete_albums(scorpion_album_id) is not None
+async def test_albums_batch(async_spotify_user_auth, ids):
+    spt = async_spotify_user_auth
 
-
-async def test_delete_albums(
-    async_spotify_user_auth, scorpion_album_id, nothing_was_the_same_album_id
-):
-    assert (
-        await async_spotify_user_auth.delete_albums(
-            [scorpion_album_id, nothing_was_the_same_album_id]
-        )
-        is not None
+    album, albums = await spt.gather(
+        spt.albums(ids.reise_reise_album_id, to_gather=True),
+        spt.albums(
+            [ids.reise_reise_album_id, ids.ritual_spirit_album_id], to_gather=True
+        ),
     )
 
-
-async def test_album(
-    async_spotify_user_auth, reise_reise_album_id, ritual_spirit_album_id
-):
-    assert await async_spotify_user_auth.albums(
-        album_ids=[reise_reise_album_id, ritual_spirit_album_id]
-    )
-
-
-async def test_albums(async_spotify_user_auth, reise_reise_album_id):
-    assert await async_spotify_user_auth.albums(reise_reise_album_id)
+    assert album
+    assert albums
@@ -1,68 +1,37 @@
 import pytest
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.vcr
 
 
-async def test_followed_artists(async_spotify_user_auth):
-    assert await async_spotify_user_auth.followed_artists() is not None
-
-
-async def test_follow_artist(async_spotify_user_auth, test_artist_id):
-    assert await async_spotify_user_auth.follow_artists(test_artist_id) is not None
-
-
-async def test_follow_artists(
-    async_spotify_user_auth, test_artist_id, testing_funny_artist_id
-):
-    assert (
-        await async_spotify_user_auth.follow_artists(
-            [test_artist_id, testing_funny_artist_id]
-        )
-        is not None
-    )
-
-
-async def test_follows_artist(async_spotify_user_auth, test_artist_id):
-    assert await async_spotify_user_auth.follows_artists(test_artist_id) is not None
-
-
-async def test_follows_artists(
-    async_spotify_user_auth, test_artist_id, testing_funny_artist_id
+@pytest.mark.xdist_group("user_state")
+async def test_follow_follows_unfollow_artists(
+    async_spotify_user_auth, gathered_lifecycle, ids
 ):
-    assert (
-        await async_spotify_user_auth.follow_artists(
-            [test_artist_id, testing_funny_artist_id]
-        )
-        is not None
-    )
-
-
-async def test_unfollow_artist(async_spotify_user_auth, test_artist_id):
-    assert await async_spotify_user_auth.unfollow_artists(test_artist_id) is not None
-
+    spt = async_spotify_user_auth
+    single = ids.test_artist_id
+    multiple = [ids.test_artist_id, ids.testing_funny_artist_id]
 
-async def test_unfollow_artists(
-    async_spotify_user_auth, test_artist_id, testing_funny_artist_id
-):
-    assert (
-        await async_spotify_user_auth.unfollow_artists(
-            [test_artist_id, testing_funny_artist_id]
-        )
-        is not None
+    followed, follows, unfollowed = await gathered_lifecycle(
+        spt.follow_artists, spt.follows_artists, spt.unfollow_artists, single, multiple
     )
+    assert all(result is not None for result in followed)
+    assert all(all(result) for result in follows)
+    assert all(result is not None for result in unfollowed)
 
 
-async def test_artist(async_spotify_user_auth, depeche_mode_artist_id):
-    assert await async_spotify_user_auth.artists(depeche_mode_artist_id)
-
+async def test_artists_batch(async_spotify_user_auth, ids):
+    spt = async_spotify_user_auth
 
-async def test_artists(
-    async_spotify_user_auth, rammstein_artist_id, depeche_mode_artist_id
-):
-    assert await async_spotify_user_auth.artists(
-        [rammstein_artist_id, depeche_mode_artist_id]
+    followed, artist, artists, related_artists = await spt.gather(
+        spt.followed_artists(to_gather=True),
+        spt.artists(ids.depeche_mode_artist_id, to_gather=True),
+        spt.artists(
+            [ids.rammstein_artist_id, ids.depeche_mode_artist_id], to_gather=True
+        ),
+        spt.artist_related_artists(ids.depeche_mode_artist_id, to_gather=True),
     )
 
-
-async def test_artist_related_artists(async_spotify_user_auth, depeche_mode_artist_id):
-    assert await async_spotify_user_auth.artist_related_artists(depeche_mode_artist_id)
+    assert followed
+    assert artist
+    assert artists
+    assert related_artists
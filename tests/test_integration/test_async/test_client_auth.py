@@ -1,37 +1,42 @@
-import pytest
+import asyncio
 import os
-import requests
+
+import pytest
 
 from pyfy import AuthError
 
 
-def test_valid_oauth_uri(async_spotify_client_auth):
+async def test_valid_oauth_uris(async_spotify_client_auth, aiohttp_session):
     # Assumes valid spotify id and "valid" spotify secret
-    assert async_spotify_client_auth.auth_uri()
-    assert requests.get(async_spotify_client_auth.auth_uri()).status_code == 200
+    spotify = async_spotify_client_auth
+    uris = [
+        spotify.auth_uri(),
+        spotify.auth_uri(show_dialog=True),
+        spotify.auth_uri(state="pyfy"),
+    ]
+
+    # Spotify reports a bad scope as a redirect to redirect_uri?error=..., so follow it and check where it lands
+    async def head(uri):
+        async with aiohttp_session.head(uri, allow_redirects=True) as response:
+            return response
+
+    responses = await asyncio.gather(*(head(uri) for uri in uris))
+    assert all(response.status == 200 for response in responses)
+    assert all("error" not in response.url.query for response in responses)
 
 
-@pytest.mark.asyncio
 async def test_bad_client_creds_raise_auth_error(async_spotify_client_auth):
     async_spotify_client_auth.client_creds.client_secret = "bad secret"
     with pytest.raises(AuthError):
         await async_spotify_client_auth.authorize_client_creds()
 
 
-@pytest.mark.asyncio
-async def test_client_authentication_async(async_spotify_client_auth):
-    await async_spotify_client_auth.authorize_client_creds()
-
-
-@pytest.mark.asyncio
-async def test_client_credentials_is_active(async_spotify_client_auth):
-    await async_spotify_client_auth.authorize_client_creds()
-    assert await async_spotify_client_auth.is_active is True
-    json_res = await async_spotify_client_auth.categories()
+async def test_client_credentials_is_active(async_spotify_client_authorized):
+    assert await async_spotify_client_authorized.is_active is True
+    json_res = await async_spotify_client_authorized.categories()
     assert isinstance(json_res, dict)
 
 
-@pytest.mark.asyncio
 async def test_client_credentials_refresh(
     async_spotify_client_auth, client_creds_from_env
 ):
@@ -39,7 +44,6 @@ async def test_client_credentials_refresh(
     assert client_creds_from_env.client_id
     async_spotify_client_auth.client_creds = client_creds_from_env
     await async_spotify_client_auth.authorize_client_creds()
-    await async_spotify_client_auth._refresh_token()
     initial_client_access = async_spotify_client_auth.client_creds.access_token
     await async_spotify_client_auth._refresh_token()
     refreshed_client_access = async_spotify_client_auth.client_creds.access_token
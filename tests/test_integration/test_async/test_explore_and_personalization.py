@@ -1,68 +1,59 @@
 import pytest
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.vcr
 
 
-async def test_category_soul(async_spotify_user_auth):
-    assert await async_spotify_user_auth.category("soul")
+async def test_categories_batch(async_spotify_user_auth):
+    spt = async_spotify_user_auth
 
+    results = await spt.gather(
+        spt.category("soul", to_gather=True),
+        spt.category("sleep", to_gather=True),
+        spt.category("jazz", to_gather=True),
+    )
 
-async def test_category_sleep(async_spotify_user_auth):
-    assert await async_spotify_user_auth.category("sleep")
-
+    assert all(results)
 
-async def test_category_jazz(async_spotify_user_auth):
-    assert await async_spotify_user_auth.category("jazz")
 
+async def test_categories(bulk_public_result):
+    assert bulk_public_result("categories")
 
-async def test_categories(async_spotify_user_auth):
-    assert await async_spotify_user_auth.categories()
 
+async def test_categories_usa(bulk_public_result):
+    assert bulk_public_result("categories_usa")
 
-async def test_categories_usa(async_spotify_user_auth):
-    assert await async_spotify_user_auth.categories(country="US")
 
+async def test_category_playlist(bulk_public_result):
+    assert bulk_public_result("category_playlist")
 
-async def test_category_playlist(async_spotify_user_auth):
-    assert await async_spotify_user_auth.category_playlist("jazz")
 
+async def test_featured_playlists(bulk_public_result):
+    assert bulk_public_result("featured_playlists")
 
-async def test_featured_playlists(async_spotify_user_auth):
-    assert await async_spotify_user_auth.featured_playlists()
 
+async def test_new_releases(bulk_public_result):
+    assert bulk_public_result("new_releases")
 
-async def test_new_releases(async_spotify_user_auth):
-    assert await async_spotify_user_auth.new_releases()
 
+async def test_recommendations(bulk_public_result):
+    assert bulk_public_result("recommendations")
 
-async def test_recommendations(async_spotify_user_auth):
-    assert await async_spotify_user_auth.recommendations(
-        market="US",
-        seed_tracks="0c6xIDDpzE81m2q797ordA",
-        min_energy=0.4,
-        min_popularity=50,
-    )
 
+async def test_track_audio_analysis(bulk_public_result):
+    assert bulk_public_result("track_audio_analysis")
 
-async def test_track_audio_analysis(async_spotify_user_auth, pound_cake_track_id):
-    await async_spotify_user_auth.track_audio_analysis(pound_cake_track_id)
 
+async def test_track_audio_feature(bulk_public_result):
+    assert bulk_public_result("track_audio_feature")
 
-async def test_track_audio_feature(async_spotify_user_auth, pound_cake_track_id):
-    await async_spotify_user_auth.tracks_audio_features(pound_cake_track_id)
 
-
-async def test_tracks_audio_features(
-    async_spotify_user_auth, pound_cake_track_id, gods_plan_track_id
-):
-    await async_spotify_user_auth.tracks_audio_features(
-        [pound_cake_track_id, gods_plan_track_id]
-    )
+async def test_tracks_audio_features(bulk_public_result):
+    assert bulk_public_result("tracks_audio_features")
 
 
-async def test_search(async_spotify_user_auth):
-    await async_spotify_user_auth.search("where's the revolution")
+async def test_search(bulk_public_result):
+    assert bulk_public_result("search")
 
 
-async def test_available_genre_seeds(async_spotify_user_auth):
-    assert await async_spotify_user_auth.available_genre_seeds()
+async def test_available_genre_seeds(bulk_public_result):
+    assert bulk_public_result("available_genre_seeds")
@@ -1,7 +1,10 @@
 import pytest
 
+from pyfy import AsyncSpotify
+
+pytestmark = pytest.mark.vcr
+
 
-@pytest.mark.asyncio
 async def test_gather(async_spotify_user_auth):
     spt = async_spotify_user_auth
 
@@ -19,8 +22,11 @@ async def test_gather(async_spotify_user_auth):
         assert len(result) != 0
 
 
-def test_gather_now(async_spotify_user_auth):
-    spt = async_spotify_user_auth
+def test_gather_now(user_creds_from_env, client_creds_from_env):
+    # gather_now runs on its own loop, so it can't share the session-scoped client's aiohttp session
+    spt = AsyncSpotify(
+        client_creds=client_creds_from_env, user_creds=user_creds_from_env
+    )
 
     results = spt.gather_now(
         spt.search("concurrency", to_gather=True),
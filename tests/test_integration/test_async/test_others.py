@@ -1,25 +1,25 @@
 import pytest
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.vcr
 
 
 async def test_user_top_artists(async_spotify_user_auth):
     assert await async_spotify_user_auth.user_top_artists()
 
 
-async def test_artist_albums(async_spotify_user_auth, depeche_mode_artist_id):
-    assert await async_spotify_user_auth.artist_albums(depeche_mode_artist_id)
+async def test_public_resources_batch(async_spotify_user_auth, ids):
+    spt = async_spotify_user_auth
 
-
-async def test_album_tracks(async_spotify_user_auth, reise_reise_album_id):
-    assert await async_spotify_user_auth.album_tracks(reise_reise_album_id)
-
-
-async def test_artist_top_tracks(async_spotify_user_auth, depeche_mode_artist_id):
-    assert await async_spotify_user_auth.artist_top_tracks(
-        depeche_mode_artist_id, country="US"
+    artist_albums, album_tracks, artist_top_tracks = await spt.gather(
+        spt.artist_albums(ids.depeche_mode_artist_id, to_gather=True),
+        spt.album_tracks(ids.reise_reise_album_id, to_gather=True),
+        spt.artist_top_tracks(ids.depeche_mode_artist_id, country="US", to_gather=True),
     )
 
+    assert artist_albums
+    assert album_tracks
+    assert artist_top_tracks
+
 
 #                                                                       #
 # TODO: Write seperate unit tests for the get_key_recursively_method()  #
@@ -47,22 +47,18 @@ async def test_previous_search(async_spotify_user_auth):
     assert len(previous) > 0
 
 
-async def test_next_featured_playlists(async_spotify_user_auth):
-    result = await async_spotify_user_auth.featured_playlists(limit=2)
-    assert len(result) > 0
-    next_ = await async_spotify_user_auth.next_page(result)
-    assert len(next_) > 0
-
-
-async def test_next_recently_played_tracks(async_spotify_user_auth):
-    result = await async_spotify_user_auth.recently_played_tracks(limit=2)
-    assert len(result) > 0
-    next_ = await async_spotify_user_auth.next_page(result)
-    assert len(next_) > 0
+async def test_next_pages_batch(async_spotify_user_auth):
+    spt = async_spotify_user_auth
 
+    # The three chains are independent, so each hop is gathered across them
+    first_pages = await spt.gather(
+        spt.featured_playlists(limit=2, to_gather=True),
+        spt.recently_played_tracks(limit=2, to_gather=True),
+        spt.user_albums(limit=2, to_gather=True),
+    )
+    assert all(len(page) > 0 for page in first_pages)
 
-async def test_next_user_albums(async_spotify_user_auth):
-    result = await async_spotify_user_auth.user_albums(limit=2)
-    assert len(result) > 0
-    next_ = await async_spotify_user_auth.next_page(result)
-    assert len(next_) > 0
+    next_pages = await spt.gather(
+        *(spt.next_page(page, to_gather=True) for page in first_pages)
+    )
+    assert all(len(page) > 0 for page in next_pages)
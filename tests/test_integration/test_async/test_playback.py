@@ -1,6 +1,6 @@
 import pytest
 
-pytestmark = pytest.mark.asyncio
+pytestmark = [pytest.mark.vcr, pytest.mark.xdist_group("user_state")]
 
 
 async def test_devices(async_spotify_user_auth):
@@ -11,30 +11,35 @@ async def test_recently_played_tracks(async_spotify_user_auth):
     assert await async_spotify_user_auth.recently_played_tracks()
 
 
-async def test_play_album(async_spotify_user_auth, reise_reise_album_id):
-    assert await async_spotify_user_auth.play(album_id=reise_reise_album_id) is not None
+async def test_play_album(async_spotify_user_auth, ids):
+    assert (
+        await async_spotify_user_auth.play(album_id=ids.reise_reise_album_id)
+        is not None
+    )
 
 
-async def test_play_single_track_id(async_spotify_user_auth, them_bones_track_id):
-    assert await async_spotify_user_auth.play(track_ids=them_bones_track_id) is not None
+async def test_play_single_track_id(async_spotify_user_auth, ids):
+    assert (
+        await async_spotify_user_auth.play(track_ids=ids.them_bones_track_id)
+        is not None
+    )
     assert await async_spotify_user_auth.pause() is not None
 
 
-async def test_play_track_ids(
-    async_spotify_user_auth, them_bones_track_id, cover_me_track_id
-):
+async def test_play_track_ids(async_spotify_user_auth, ids):
     assert (
         await async_spotify_user_auth.play(
-            track_ids=[them_bones_track_id, cover_me_track_id]
+            track_ids=[ids.them_bones_track_id, ids.cover_me_track_id]
         )
         is not None
     )
     assert await async_spotify_user_auth.pause() is not None
 
 
-async def test_play_artist(async_spotify_user_auth, depeche_mode_artist_id):
+async def test_play_artist(async_spotify_user_auth, ids):
     assert (
-        await async_spotify_user_auth.play(artist_id=depeche_mode_artist_id) is not None
+        await async_spotify_user_auth.play(artist_id=ids.depeche_mode_artist_id)
+        is not None
     )
     assert await async_spotify_user_auth.pause() is not None
 
@@ -80,5 +85,5 @@ async def test_pause(async_spotify_user_auth):
     assert await async_spotify_user_auth.pause() is not None
 
 
-async def test_queue(async_spotify_user_auth, them_bones_track_id):
-    assert await async_spotify_user_auth.queue(them_bones_track_id) is not None
+async def test_queue(async_spotify_user_auth, ids):
+    assert await async_spotify_user_auth.queue(ids.them_bones_track_id) is not None
@@ -2,7 +2,7 @@ import pytest
 
 from pyfy import AsyncSpotify as Spotify
 
-pytestmark = pytest.mark.asyncio
+pytestmark = [pytest.mark.vcr, pytest.mark.xdist_group("user_state")]
 
 
 async def test_user_playlists(user_creds_from_env, client_creds_from_env):
@@ -11,119 +11,76 @@ async def test_user_playlists(user_creds_from_env, client_creds_from_env):
     assert await c.user_playlists()
 
 
-async def test_follow_playlist(async_spotify_user_auth, brian_eno_playlist_id):
+async def test_follow_playlist(async_spotify_user_auth, ids):
     assert (
-        await async_spotify_user_auth.follow_playlist(brian_eno_playlist_id) is not None
+        await async_spotify_user_auth.follow_playlist(ids.brian_eno_playlist_id)
+        is not None
     )
 
 
-async def test_follows_playlist(async_spotify_user_auth, brian_eno_playlist_id):
-    assert (
-        await async_spotify_user_auth.follows_playlist(brian_eno_playlist_id)
-        is not None
+async def test_follows_playlist(async_spotify_user_auth, ids):
+    assert all(
+        await async_spotify_user_auth.follows_playlist(ids.brian_eno_playlist_id)
     )
 
 
-async def test_unfollow_playlist(async_spotify_user_auth, brian_eno_playlist_id):
+async def test_unfollow_playlist(async_spotify_user_auth, ids):
     assert (
-        await async_spotify_user_auth.unfollow_playlist(brian_eno_playlist_id)
+        await async_spotify_user_auth.unfollow_playlist(ids.brian_eno_playlist_id)
         is not None
     )
 
 
-async def test_create_playlist(async_spotify_user_auth, new_playlist_name):
-    assert await async_spotify_user_auth.create_playlist(new_playlist_name) is not None
+async def test_create_and_delete_playlist(async_spotify_user_auth, new_playlist_name):
+    playlist = await async_spotify_user_auth.create_playlist(new_playlist_name)
+    assert playlist["id"]
+    assert await async_spotify_user_auth.delete_playlist(playlist["id"]) is not None
 
 
 async def test_update_playlist(
-    async_spotify_user_auth, new_playlist_id, new_playlist_name
+    async_spotify_user_auth, owned_playlist, new_playlist_name
 ):
     assert (
         await async_spotify_user_auth.update_playlist(
-            new_playlist_id, "NEWNAMENOONECANTHINKOF"
+            owned_playlist, "NEWNAMENOONECANTHINKOF"
         )
         is not None
     )
     assert (
-        await async_spotify_user_auth.update_playlist(
-            new_playlist_id, new_playlist_name
-        )
+        await async_spotify_user_auth.update_playlist(owned_playlist, new_playlist_name)
         is not None
     )
 
 
-async def test_add_playlist_tracks(
-    async_spotify_user_auth, new_playlist_id, them_bones_track_id, gods_plan_track_id
-):
-    assert (
-        await async_spotify_user_auth.add_playlist_tracks(
-            new_playlist_id, [them_bones_track_id, gods_plan_track_id]
-        )
-        is not None
-    )
+async def test_playlist_tracks_lifecycle(async_spotify_user_auth, owned_playlist, ids):
+    spt = async_spotify_user_auth
 
-
-async def test_playlist_tracks(
-    async_spotify_user_auth, new_playlist_id, them_bones_track_id
-):
-    assert await async_spotify_user_auth.playlist_tracks(new_playlist_id)
-
-
-async def test_reorder_playlist_track(
-    async_spotify_user_auth, new_playlist_id, sonne_track_id
-):
-    assert (
-        await async_spotify_user_auth.add_playlist_tracks(
-            new_playlist_id, sonne_track_id
-        )
-        is not None
+    # Each write builds on the track order left by the previous one, the reads in between don't
+    assert await spt.add_playlist_tracks(
+        owned_playlist, [ids.them_bones_track_id, ids.gods_plan_track_id]
     )
-    assert (
-        await async_spotify_user_auth.reorder_playlist_track(
-            new_playlist_id, range_start=1, insert_before=0
-        )
-        is not None
+    assert await spt.add_playlist_tracks(owned_playlist, ids.sonne_track_id)
+    assert await spt.reorder_playlist_track(
+        owned_playlist, range_start=1, insert_before=0
     )
 
-
-async def test_replace_playlist_tracks(
-    async_spotify_user_auth, new_playlist_id, sonne_track_id, them_bones_track_id
-):
-    assert (
-        await async_spotify_user_auth.add_playlist_tracks(
-            new_playlist_id, sonne_track_id
-        )
-        is not None
+    tracks, cover = await spt.gather(
+        spt.playlist_tracks(owned_playlist, to_gather=True),
+        spt.playlist_cover(owned_playlist, to_gather=True),
     )
-    assert (
-        await async_spotify_user_auth.replace_playlist_tracks(
-            new_playlist_id, track_ids=[them_bones_track_id]
-        )
-        is not None
-    )
-
+    assert tracks
+    assert cover is not None
 
-async def test_delete_playlist_tracks(
-    async_spotify_user_auth, new_playlist_id, gods_plan_track_id, them_bones_track_id
-):
-    await async_spotify_user_auth.replace_playlist_tracks(
-        new_playlist_id, track_ids=[them_bones_track_id, gods_plan_track_id]
-    )
     assert (
-        await async_spotify_user_auth.delete_playlist_tracks(
-            new_playlist_id,
-            [
-                {"id": them_bones_track_id, "positions": 0},
-                {"id": gods_plan_track_id, "positions": 1},
-            ],
+        await spt.replace_playlist_tracks(
+            owned_playlist, track_ids=[ids.them_bones_track_id, ids.gods_plan_track_id]
         )
         is not None
     )
-
-
-async def test_delete_playlist(async_spotify_user_auth, new_playlist_id):
-    assert await async_spotify_user_auth.delete_playlist(new_playlist_id) is not None
-
-
-async def test_playlist_cover(async_spotify_user_auth, new_playlist_id):
-    assert await async_spotify_user_auth.playlist_cover(new_playlist_id) is not None
+    assert await spt.delete_playlist_tracks(
+        owned_playlist,
+        [
+            {"id": ids.them_bones_track_id, "positions": 0},
+            {"id": ids.gods_plan_track_id, "positions": 1},
+        ],
+    )
@@ -1,11 +1,11 @@
 import pytest
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.vcr
 
 
 async def test_me(async_spotify_user_auth):
     assert await async_spotify_user_auth.me()
 
 
-async def test_user_profile(async_spotify_user_auth, john_smith_user_id):
-    assert await async_spotify_user_auth.user_profile(john_smith_user_id)
+async def test_user_profile(async_spotify_user_auth, ids):
+    assert await async_spotify_user_auth.user_profile(ids.john_smith_user_id)
@@ -1,53 +1,31 @@
 import pytest
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.vcr
 
 
-async def test_save_track(async_spotify_user_auth, gods_plan_track_id):
-    assert await async_spotify_user_auth.save_tracks(gods_plan_track_id) is not None
-
-
-async def test_save_tracks(
-    async_spotify_user_auth, gods_plan_track_id, pound_cake_track_id
+@pytest.mark.xdist_group("user_state")
+async def test_save_owns_delete_tracks(
+    async_spotify_user_auth, gathered_lifecycle, ids
 ):
-    assert (
-        await async_spotify_user_auth.save_tracks(
-            [gods_plan_track_id, pound_cake_track_id]
-        )
-        is not None
-    )
-
-
-async def test_owns_track(async_spotify_user_auth, pound_cake_track_id):
-    assert await async_spotify_user_auth.owns_tracks(pound_cake_track_id)
-
+    spt = async_spotify_user_auth
+    single = ids.pound_cake_track_id
+    multiple = [ids.gods_plan_track_id, ids.pound_cake_track_id]
 
-async def test_owns_tracks(
-    async_spotify_user_auth, pound_cake_track_id, gods_plan_track_id
-):
-    assert await async_spotify_user_auth.owns_tracks(
-        [pound_cake_track_id, gods_plan_track_id]
+    saved, owned, deleted = await gathered_lifecycle(
+        spt.save_tracks, spt.owns_tracks, spt.delete_tracks, single, multiple
     )
+    assert all(result is not None for result in saved)
+    assert all(all(result) for result in owned)
+    assert all(result is not None for result in deleted)
 
 
-async def test_delete_track(async_spotify_user_auth, pound_cake_track_id):
-    assert await async_spotify_user_auth.delete_tracks(pound_cake_track_id) is not None
-
+async def test_tracks_batch(async_spotify_user_auth, ids):
+    spt = async_spotify_user_auth
 
-async def test_delete_tracks(
-    async_spotify_user_auth, pound_cake_track_id, gods_plan_track_id
-):
-    assert (
-        await async_spotify_user_auth.delete_tracks(
-            [pound_cake_track_id, gods_plan_track_id]
-        )
-        is not None
+    track, tracks = await spt.gather(
+        spt.tracks(ids.sonne_track_id, to_gather=True),
+        spt.tracks([ids.sonne_track_id, ids.in_your_room_track_id], to_gather=True),
     )
 
-
-async def test_track(async_spotify_user_auth, sonne_track_id):
-    assert await async_spotify_user_auth.tracks(sonne_track_id)
-
-
-async def test_tracks(async_spotify_user_auth, sonne_track_id, in_your_room_track_id):
-    assert await async_spotify_user_auth.tracks([sonne_track_id, in_your_room_track_id])
+    assert track
+    assert tracks
@@ -1,51 +1,22 @@
 import pytest
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.vcr
 
 
-async def test_follow_user(async_spotify_user_auth, john_smith_user_id):
-    assert await async_spotify_user_auth.follow_users(john_smith_user_id) is not None
-
-
-async def test_follow_users(
-    async_spotify_user_auth, john_smith_user_id, spotify_test_user_id
+@pytest.mark.xdist_group("user_state")
+async def test_follow_follows_unfollow_users(
+    async_spotify_user_auth, gathered_lifecycle, ids
 ):
-    assert (
-        await async_spotify_user_auth.follow_users(
-            [john_smith_user_id, spotify_test_user_id]
-        )
-        is not None
-    )
-
+    spt = async_spotify_user_auth
+    single = ids.john_smith_user_id
+    multiple = [ids.john_smith_user_id, ids.spotify_test_user_id]
 
-async def test_follows_user(async_spotify_user_auth, john_smith_user_id):
-    assert await async_spotify_user_auth.follows_users(john_smith_user_id) is not None
-
-
-async def test_follows_users(
-    async_spotify_user_auth, john_smith_user_id, spotify_test_user_id
-):
-    assert (
-        await async_spotify_user_auth.follows_users(
-            [john_smith_user_id, spotify_test_user_id]
-        )
-        is not None
-    )
-
-
-async def test_unfollow_user(async_spotify_user_auth, john_smith_user_id):
-    assert await async_spotify_user_auth.unfollow_users(john_smith_user_id) is not None
-
-
-async def test_unfollow_users(
-    async_spotify_user_auth, john_smith_user_id, spotify_test_user_id
-):
-    assert (
-        await async_spotify_user_auth.unfollow_users(
-            [john_smith_user_id, spotify_test_user_id]
-        )
-        is not None
+    followed, follows, unfollowed = await gathered_lifecycle(
+        spt.follow_users, spt.follows_users, spt.unfollow_users, single, multiple
     )
+    assert all(result is not None for result in followed)
+    assert all(all(result) for result in follows)
+    assert all(result is not None for result in unfollowed)
 
 
 async def test_user_top_tracks(async_spotify_user_auth):
@@ -1,8 +1,6 @@
 from pyfy import AsyncSpotify as Spotify, AuthError, ClientCreds
 import pytest
 
-
-pytestmark = pytest.mark.asyncio
 ## This submodule must test authentication without having a client credentials model set to the client.
 
 empty_client_creds = ClientCreds()
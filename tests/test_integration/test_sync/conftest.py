@@ -0,0 +1,20 @@
+from pytest import fixture
+
+
+@fixture(scope="session")
+def spotify_user_auth(spotify_user_auth, session_cassette):
+    # Fills in the user's id, country etc. once and on tape, so no test's cassette depends on which test fetched them first
+    with session_cassette("spotify_user_auth"):
+        spotify_user_auth.populate_user_creds()
+    yield spotify_user_auth
+
+
+@fixture(scope="module")
+def owned_playlist(spotify_user_auth, new_playlist_name, module_cassette):
+    # Created once for the module's playlist tests and deleted when they're done
+    # Recorded, so the tests' own cassettes replay against the same playlist id
+    with module_cassette("owned_playlist_create"):
+        playlist = spotify_user_auth.create_playlist(new_playlist_name)
+    yield playlist["id"]
+    with module_cassette("owned_playlist_delete"):
+        spotify_user_auth.delete_playlist(playlist["id"])
@@ -1,47 +1,36 @@
-def test_followed_artists(spotify_user_auth):
-    assert spotify_user_auth.followed_artists() is not None
+import pytest
 
+pytestmark = pytest.mark.vcr
 
-def test_follow_artist(spotify_user_auth, test_artist_id):
-    assert spotify_user_auth.follow_artists(test_artist_id) is not None
 
-
-def test_follow_artists(spotify_user_auth, test_artist_id, testing_funny_artist_id):
-    assert (
-        spotify_user_auth.follow_artists([test_artist_id, testing_funny_artist_id])
-        is not None
-    )
-
-
-def test_follows_artist(spotify_user_auth, test_artist_id):
-    assert spotify_user_auth.follows_artists(test_artist_id) is not None
+def test_followed_artists(spotify_user_auth):
+    assert spotify_user_auth.followed_artists() is not None
 
 
-def test_follows_artists(spotify_user_auth, test_artist_id, testing_funny_artist_id):
-    assert (
-        spotify_user_auth.follow_artists([test_artist_id, testing_funny_artist_id])
-        is not None
+@pytest.mark.xdist_group("user_state")
+@pytest.mark.parametrize("multiple", [False, True], ids=["single", "multiple"])
+def test_follow_lifecycle(spotify_user_auth, ids, multiple):
+    # Covers both the str and the list form of artist_ids in one follow/follows/unfollow round
+    artist_ids = (
+        [ids.test_artist_id, ids.testing_funny_artist_id]
+        if multiple
+        else ids.test_artist_id
     )
 
-
-def test_unfollow_artist(spotify_user_auth, test_artist_id):
-    assert spotify_user_auth.unfollow_artists(test_artist_id) is not None
-
-
-def test_unfollow_artists(spotify_user_auth, test_artist_id, testing_funny_artist_id):
-    assert (
-        spotify_user_auth.unfollow_artists([test_artist_id, testing_funny_artist_id])
-        is not None
-    )
+    assert spotify_user_auth.follow_artists(artist_ids) is not None
+    assert all(spotify_user_auth.follows_artists(artist_ids))
+    assert spotify_user_auth.unfollow_artists(artist_ids) is not None
 
 
-def test_artist(spotify_user_auth, depeche_mode_artist_id):
-    assert spotify_user_auth.artists(depeche_mode_artist_id)
+def test_artist(spotify_user_auth, ids):
+    assert spotify_user_auth.artists(ids.depeche_mode_artist_id)
 
 
-def test_artists(spotify_user_auth, rammstein_artist_id, depeche_mode_artist_id):
-    assert spotify_user_auth.artists([rammstein_artist_id, depeche_mode_artist_id])
+def test_artists(spotify_user_auth, ids):
+    assert spotify_user_auth.artists(
+        [ids.rammstein_artist_id, ids.depeche_mode_artist_id]
+    )
 
 
-def test_artist_related_artists(spotify_user_auth, depeche_mode_artist_id):
-    assert spotify_user_auth.artist_related_artists(depeche_mode_artist_id)
+def test_artist_related_artists(spotify_user_auth, ids):
+    assert spotify_user_auth.artist_related_artists(ids.depeche_mode_artist_id)
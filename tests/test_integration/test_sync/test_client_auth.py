@@ -1,3 +1,5 @@
+from urllib.parse import urlparse, parse_qs
+
 import pytest
 import requests
 
@@ -6,11 +8,13 @@ from pyfy import AuthError
 
 def test_all_scopes_are_valid(spotify_client_auth):
     assert spotify_client_auth.auth_uri()
-    assert requests.get(spotify_client_auth.auth_uri()).status_code == 200
-
-
-def test_client_credentials_oauth(spotify_client_auth):
-    spotify_client_auth.authorize_client_creds()
+    # Spotify reports a bad scope as a redirect to redirect_uri?error=..., so follow it and check where it lands
+    # requests keeps HEAD as HEAD across the redirects, so the login page itself isn't downloaded
+    response = requests.head(
+        spotify_client_auth.auth_uri(), allow_redirects=True, timeout=5
+    )
+    assert response.status_code == 200
+    assert "error" not in parse_qs(urlparse(response.url).query)
 
 
 def test_client_credentials_oauth_invalid(spotify_client_auth):
@@ -19,16 +23,14 @@ def test_client_credentials_oauth_invalid(spotify_client_auth):
         spotify_client_auth.authorize_client_creds()
 
 
-def test_client_credentials_oauth_is_authorized(spotify_client_auth):
+def test_client_credentials_oauth_is_authorized(spotify_client_authorized):
     # https://developer.spotify.com/documentation/web-api/reference/browse/get-list-categories/
-    spotify_client_auth.authorize_client_creds()
-    assert spotify_client_auth.is_active
-    assert spotify_client_auth.categories()
+    assert spotify_client_authorized.is_active
+    assert spotify_client_authorized.categories()
 
 
 def test_client_credentials_refresh(spotify_client_auth):
     spotify_client_auth.authorize_client_creds()
-    spotify_client_auth._refresh_token()
     initial_client_access = spotify_client_auth.client_creds.access_token
     spotify_client_auth._refresh_token()
     refreshed_client_access = spotify_client_auth.client_creds.access_token
@@ -1,3 +1,8 @@
+import pytest
+
+pytestmark = pytest.mark.vcr
+
+
 def test_category(spotify_user_auth):
     assert spotify_user_auth.category("sleep")
     assert spotify_user_auth.category("soul")
@@ -33,18 +38,18 @@ def test_recommendations(spotify_user_auth):
     )
 
 
-def test_track_audio_analysis(spotify_user_auth, pound_cake_track_id):
-    spotify_user_auth.track_audio_analysis(pound_cake_track_id)
+def test_track_audio_analysis(spotify_user_auth, ids):
+    spotify_user_auth.track_audio_analysis(ids.pound_cake_track_id)
 
 
-def test_track_audio_feature(spotify_user_auth, pound_cake_track_id):
-    spotify_user_auth.tracks_audio_features(pound_cake_track_id)
+def test_track_audio_feature(spotify_user_auth, ids):
+    spotify_user_auth.tracks_audio_features(ids.pound_cake_track_id)
 
 
-def test_tracks_audio_features(
-    spotify_user_auth, pound_cake_track_id, gods_plan_track_id
-):
-    spotify_user_auth.tracks_audio_features([pound_cake_track_id, gods_plan_track_id])
+def test_tracks_audio_features(spotify_user_auth, ids):
+    spotify_user_auth.tracks_audio_features(
+        [ids.pound_cake_track_id, ids.gods_plan_track_id]
+    )
 
 
 def test_search(spotify_user_auth):
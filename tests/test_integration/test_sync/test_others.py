@@ -1,17 +1,22 @@
+import pytest
+
+pytestmark = pytest.mark.vcr
+
+
 def test_user_top_artists(spotify_user_auth):
     assert spotify_user_auth.user_top_artists()
 
 
-def test_artist_albums(spotify_user_auth, depeche_mode_artist_id):
-    assert spotify_user_auth.artist_albums(depeche_mode_artist_id)
+def test_artist_albums(spotify_user_auth, ids):
+    assert spotify_user_auth.artist_albums(ids.depeche_mode_artist_id)
 
 
-def test_album_tracks(spotify_user_auth, reise_reise_album_id):
-    assert spotify_user_auth.album_tracks(reise_reise_album_id)
+def test_album_tracks(spotify_user_auth, ids):
+    assert spotify_user_auth.album_tracks(ids.reise_reise_album_id)
 
 
-def test_artist_top_tracks(spotify_user_auth, depeche_mode_artist_id):
-    assert spotify_user_auth.artist_top_tracks(depeche_mode_artist_id, country="US")
+def test_artist_top_tracks(spotify_user_auth, ids):
+    assert spotify_user_auth.artist_top_tracks(ids.depeche_mode_artist_id, country="US")
 
 
 #                                                                       #
@@ -1,3 +1,8 @@
+import pytest
+
+pytestmark = [pytest.mark.vcr, pytest.mark.xdist_group("user_state")]
+
+
 def test_devices(spotify_user_auth):
     assert spotify_user_auth.devices()
 
@@ -6,27 +11,27 @@ def test_recently_played_tracks(spotify_user_auth):
     assert spotify_user_auth.recently_played_tracks()
 
 
-def test_play_album(spotify_user_auth, reise_reise_album_id):
-    assert spotify_user_auth.play(album_id=reise_reise_album_id) is not None
+def test_play_album(spotify_user_auth, ids):
+    assert spotify_user_auth.play(album_id=ids.reise_reise_album_id) is not None
 
 
-def test_play_single_track(spotify_user_auth, them_bones_track_id):
-    assert spotify_user_auth.play(track_ids=them_bones_track_id) is not None
+def test_play_single_track(spotify_user_auth, ids):
+    assert spotify_user_auth.play(track_ids=ids.them_bones_track_id) is not None
     assert spotify_user_auth.pause() is not None
 
 
-def test_play_multiple_tracks(
-    spotify_user_auth, them_bones_track_id, cover_me_track_id
-):
+def test_play_multiple_tracks(spotify_user_auth, ids):
     assert (
-        spotify_user_auth.play(track_ids=[them_bones_track_id, cover_me_track_id])
+        spotify_user_auth.play(
+            track_ids=[ids.them_bones_track_id, ids.cover_me_track_id]
+        )
         is not None
     )
     assert spotify_user_auth.pause() is not None
 
 
-def test_play_artist(spotify_user_auth, depeche_mode_artist_id):
-    assert spotify_user_auth.play(artist_id=depeche_mode_artist_id) is not None
+def test_play_artist(spotify_user_auth, ids):
+    assert spotify_user_auth.play(artist_id=ids.depeche_mode_artist_id) is not None
     assert spotify_user_auth.pause() is not None
 
 
@@ -71,5 +76,5 @@ def test_pause(spotify_user_auth):
     assert spotify_user_auth.pause() is not None
 
 
-def test_queue(spotify_user_auth, them_bones_track_id):
-    assert spotify_user_auth.queue(them_bones_track_id) is not None
+def test_queue(spotify_user_auth, ids):
+    assert spotify_user_auth.queue(ids.them_bones_track_id) is not None
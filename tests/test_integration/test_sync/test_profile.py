@@ -1,6 +1,11 @@
+import pytest
+
+pytestmark = pytest.mark.vcr
+
+
 def test_me(spotify_user_auth):
     assert spotify_user_auth.me()
 
 
-def test_user_profile(spotify_user_auth, john_smith_user_id):
-    assert spotify_user_auth.user_profile(john_smith_user_id)
+def test_user_profile(spotify_user_auth, ids):
+    assert spotify_user_auth.user_profile(ids.john_smith_user_id)
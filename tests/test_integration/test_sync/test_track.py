@@ -1,36 +1,55 @@
-def test_save_track(spotify_user_auth, gods_plan_track_id):
-    assert spotify_user_auth.save_tracks(gods_plan_track_id) is not None
+import pytest
 
+pytestmark = pytest.mark.vcr
 
-def test_save_tracks(spotify_user_auth, gods_plan_track_id, pound_cake_track_id):
+
+@pytest.mark.xdist_group("user_state")
+def test_save_track(spotify_user_auth, ids):
+    assert spotify_user_auth.save_tracks(ids.gods_plan_track_id) is not None
+
+
+@pytest.mark.xdist_group("user_state")
+def test_save_tracks(spotify_user_auth, ids):
     assert (
-        spotify_user_auth.save_tracks([gods_plan_track_id, pound_cake_track_id])
+        spotify_user_auth.save_tracks([ids.gods_plan_track_id, ids.pound_cake_track_id])
         is not None
     )
 
 
-def test_owns_track(spotify_user_auth, pound_cake_track_id):
-    assert spotify_user_auth.owns_tracks(pound_cake_track_id)
+@pytest.mark.xdist_group("user_state")
+@pytest.mark.order(after="test_save_tracks")
+def test_owns_track(spotify_user_auth, ids):
+    assert spotify_user_auth.owns_tracks(ids.pound_cake_track_id)
 
 
-def test_owns_tracks(spotify_user_auth, pound_cake_track_id, gods_plan_track_id):
-    assert spotify_user_auth.owns_tracks([pound_cake_track_id, gods_plan_track_id])
+@pytest.mark.xdist_group("user_state")
+@pytest.mark.order(after="test_save_tracks")
+def test_owns_tracks(spotify_user_auth, ids):
+    assert spotify_user_auth.owns_tracks(
+        [ids.pound_cake_track_id, ids.gods_plan_track_id]
+    )
 
 
-def test_delete_track(spotify_user_auth, pound_cake_track_id):
-    assert spotify_user_auth.delete_tracks(pound_cake_track_id) is not None
+@pytest.mark.xdist_group("user_state")
+@pytest.mark.order(after="test_owns_tracks")
+def test_delete_track(spotify_user_auth, ids):
+    assert spotify_user_auth.delete_tracks(ids.pound_cake_track_id) is not None
 
 
-def test_delete_tracks(spotify_user_auth, pound_cake_track_id, gods_plan_track_id):
+@pytest.mark.xdist_group("user_state")
+@pytest.mark.order(after="test_owns_tracks")
+def test_delete_tracks(spotify_user_auth, ids):
     assert (
-        spotify_user_auth.delete_tracks([pound_cake_track_id, gods_plan_track_id])
+        spotify_user_auth.delete_tracks(
+            [ids.pound_cake_track_id, ids.gods_plan_track_id]
+        )
         is not None
     )
 
 
-def test_track(spotify_user_auth, sonne_track_id):
-    assert spotify_user_auth.tracks(sonne_track_id)
+def test_track(spotify_user_auth, ids):
+    assert spotify_user_auth.tracks(ids.sonne_track_id)
 
 
-def test_tracks(spotify_user_auth, sonne_track_id, in_your_room_track_id):
-    assert spotify_user_auth.tracks([sonne_track_id, in_your_room_track_id])
+def test_tracks(spotify_user_auth, ids):
+    assert spotify_user_auth.tracks([ids.sonne_track_id, ids.in_your_room_track_id])
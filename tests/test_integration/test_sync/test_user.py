@@ -1,34 +1,21 @@
-def test_follow_user(spotify_user_auth, john_smith_user_id):
-    assert spotify_user_auth.follow_users(john_smith_user_id) is not None
+import pytest
 
-
-def test_follow_users(spotify_user_auth, john_smith_user_id, spotify_test_user_id):
-    assert (
-        spotify_user_auth.follow_users([john_smith_user_id, spotify_test_user_id])
-        is not None
-    )
-
-
-def test_follows_user(spotify_user_auth, john_smith_user_id):
-    assert spotify_user_auth.follows_users(john_smith_user_id) is not None
+pytestmark = pytest.mark.vcr
 
 
-def test_follows_users(spotify_user_auth, john_smith_user_id, spotify_test_user_id):
-    assert (
-        spotify_user_auth.follows_users([john_smith_user_id, spotify_test_user_id])
-        is not None
+@pytest.mark.xdist_group("user_state")
+@pytest.mark.parametrize("multiple", [False, True], ids=["single", "multiple"])
+def test_follow_lifecycle(spotify_user_auth, ids, multiple):
+    # Covers both the str and the list form of user_ids in one follow/follows/unfollow round
+    user_ids = (
+        [ids.john_smith_user_id, ids.spotify_test_user_id]
+        if multiple
+        else ids.john_smith_user_id
     )
 
-
-def test_unfollow_user(spotify_user_auth, john_smith_user_id):
-    assert spotify_user_auth.unfollow_users(john_smith_user_id) is not None
-
-
-def test_unfollow_users(spotify_user_auth, john_smith_user_id, spotify_test_user_id):
-    assert (
-        spotify_user_auth.unfollow_users([john_smith_user_id, spotify_test_user_id])
-        is not None
-    )
+    assert spotify_user_auth.follow_users(user_ids) is not None
+    assert all(spotify_user_auth.follows_users(user_ids))
+    assert spotify_user_auth.unfollow_users(user_ids) is not None
 
 
 def test_user_top_tracks(spotify_user_auth):
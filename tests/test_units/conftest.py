@@ -0,0 +1,47 @@
+import json
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+from pytest import fixture
+
+
+PLACEHOLDER_ENV = {
+    "SPOTIFY_CLIENT_ID": "PLACEHOLDER_CLIENT_ID",
+    "SPOTIFY_CLIENT_SECRET": "PLACEHOLDER_CLIENT_SECRET",
+    "SPOTIFY_REDIRECT_URI": "http://localhost:5000/callback/spotify",
+    "SPOTIFY_ACCESS_TOKEN": "PLACEHOLDER_ACCESS_TOKEN",
+    "SPOTIFY_REFRESH_TOKEN": "PLACEHOLDER_REFRESH_TOKEN",
+}
+
+
+@fixture(autouse=True)
+def placeholder_env(monkeypatch):
+    # Unit tests never talk to Spotify, so they don't need (or read) real credentials
+    for key, value in PLACEHOLDER_ENV.items():
+        monkeypatch.setenv(key, value)
+
+
+class _RateLimitedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps(
+            {"error": {"status": 429, "message": "API rate limit exceeded"}}
+        ).encode()
+        self.send_response(429)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@fixture
+def rate_limited_url():
+    # A local server that answers every request with a 429
+    server = HTTPServer(("127.0.0.1", 0), _RateLimitedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{}/v1/me".format(server.server_port)
+    server.shutdown()
+    server.server_close()
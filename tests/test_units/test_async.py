@@ -3,3 +3,14 @@ from pyfy.async_client import AsyncSpotify
 
 def test_async_instantiates_empty():
     AsyncSpotify()
+
+
+async def test_async_sends_requests_through_provided_session(mocker):
+    session = object()
+    spt = AsyncSpotify(session=session)
+    send = mocker.patch.object(spt, "_send_request_with_backoff")
+    request = {"url": "https://api.spotify.com/v1/me", "headers": {}}
+
+    await spt._send_requests(request)
+
+    send.assert_awaited_once_with(request, session)
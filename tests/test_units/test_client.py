@@ -1,4 +1,6 @@
-from pyfy import Spotify, UserCreds
+from requests import Request
+
+from pyfy import Spotify, UserCreds, ApiError
 import pytest
 
 
@@ -50,3 +52,16 @@ def test_populate_user_creds(me_stub):
     spt._populate_user_creds(me_stub)
     assert getattr(spt.user_creds, "type", None) is None
     assert spt.user_creds.product == "premium"
+
+
+def test_session_retries_rate_limited_https_requests():
+    spt = Spotify(populate_user_creds=False)
+    adapter = spt._session.get_adapter("https://api.spotify.com/v1/me")
+    assert 429 in adapter.max_retries.status_forcelist
+
+
+def test_session_raises_api_error_when_rate_limit_retries_run_out(rate_limited_url):
+    spt = Spotify(populate_user_creds=False, max_retries=2, backoff_factor=0)
+    with pytest.raises(ApiError) as e:
+        spt._send_request(Request("GET", rate_limited_url))
+    assert e.value.code == 429
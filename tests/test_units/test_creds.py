@@ -35,30 +35,21 @@ def test_client_is_not_oauth_ready_without_redirect_uri(client_creds_from_env):
     )  # assert not ready when there's no redirect uri
 
 
-def test_creds_pickle(user_creds_from_env):
-    user_creds_from_env.pickle()
-    user_creds_from_env._delete_pickle()
-
-
-def test_creds_pickle_loads_data_properly(user_creds_from_env):
-    user_creds_from_env.pickle()
-    new_user_creds = UserCreds.unpickle()
+def test_creds_pickle_round_trip(user_creds_from_env, tmp_path):
+    user_creds_from_env.pickle(path=tmp_path)
+    new_user_creds = UserCreds.unpickle(path=tmp_path)
     assert new_user_creds.__dict__ == user_creds_from_env.__dict__
-    user_creds_from_env._delete_pickle()
-
-
-def test_creds_json_flow(user_creds_from_env):
-    user_creds_from_env.save_as_json()
-    user_creds_from_env.load_from_json()
-    user_creds_from_env._delete_json()
+    user_creds_from_env._delete_pickle(path=tmp_path)
+    assert not list(tmp_path.iterdir())
 
 
-def test_creds_json_loads_data_properly(user_creds_from_env):
-    user_creds_from_env.save_as_json()
+def test_creds_json_round_trip(user_creds_from_env, tmp_path):
+    user_creds_from_env.save_as_json(path=tmp_path)
     new_user_creds = UserCreds()
-    new_user_creds.load_from_json()
+    new_user_creds.load_from_json(path=tmp_path)
     assert new_user_creds.__dict__ == user_creds_from_env.__dict__
-    user_creds_from_env._delete_json()
+    user_creds_from_env._delete_json(path=tmp_path)
+    assert not list(tmp_path.iterdir())
 
 
 def test_creds_is_not_instantiable():
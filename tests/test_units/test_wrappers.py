@@ -1,5 +1,3 @@
-import pytest
-
 from pyfy.wrappers import _set_and_get_me_attr_async, _set_and_get_me_attr_sync
 
 from pyfy import Spotify, UserCreds, AsyncSpotify
@@ -14,7 +12,6 @@ def test_and_get_me_attr_attr_exists():
     assert _set_and_get_me_attr_sync(spt, "id") == "id1234"
 
 
-@pytest.mark.asyncio
 async def test_and_get_me_attr_attr_exists_async():
     spt = AsyncSpotify()
 